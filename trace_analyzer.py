@@ -12,112 +12,464 @@ Example:
     python3 trace_analyzer.py trace.log --entry "doRequest ENTRY" --exit "doRequest RETURN" --threshold 3
 """
 
-import re
+import math
+import mmap
+import os
 import argparse
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+import functools
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple, Optional, Union
 import sys
+import heapq
+from concurrent.futures import ProcessPoolExecutor
 
 
-class TraceEntry:
-    def __init__(self, timestamp_str: str, thread_id: str, method_name: str, entry_type: str, raw_line: str):
-        self.timestamp_str = timestamp_str
-        self.thread_id = thread_id
-        self.method_name = method_name
-        self.entry_type = entry_type
-        self.raw_line = raw_line
-        self.timestamp = self._parse_timestamp(timestamp_str)
-    
-    def _parse_timestamp(self, timestamp_str: str) -> datetime:
-        """Parse timestamp from format: [9/12/25, 13:25:29:271 CDT]"""
+# Many lines share the same timestamp, so cache parsed values keyed on the
+# raw timestamp bytes; cleared wholesale if it grows too large.
+_TS_CACHE: Dict[bytes, int] = {}
+_TS_CACHE_MAX = 1_000_000
+
+# Decoded, interned thread ids by their raw bytes
+_THREAD_IDS: Dict[bytes, str] = {}
+
+# Bytes read per chunk when streaming the trace file
+_READ_SIZE = 4 << 20
+
+
+def _line_break(buf, start: int, end: int) -> bytes:
+    """Line terminator to split buf[start:end] on: b'\r' for old Mac-style
+    files with no b'\n' in that span, otherwise b'\n' (a trailing b'\r' of
+    CRLF endings is stripped with the rest of the whitespace)"""
+    if buf.find(b'\n', start, end) < 0 and buf.find(b'\r', start, end) >= 0:
+        return b'\r'
+    return b'\n'
+
+
+# Timestamps are held as integer microseconds since this instant
+_TIME_ORIGIN = datetime(1, 1, 1)
+
+
+def _to_micros(day: date, hour: int, minute: int, second: int, micros: int) -> int:
+    """Microseconds from _TIME_ORIGIN to the given wall-clock time"""
+    seconds = (day.toordinal() - 1) * 86400 + hour * 3600 + minute * 60 + second
+    return seconds * 1_000_000 + micros
+
+
+def _from_micros(micros: int) -> datetime:
+    """Inverse of _to_micros, for display"""
+    return _TIME_ORIGIN + timedelta(microseconds=micros)
+
+
+_DIGITS = frozenset('0123456789')
+
+
+def _check_digits(field: str, min_len: int, max_len: int):
+    """Raise ValueError unless field is min_len..max_len ASCII digits"""
+    if not (min_len <= len(field) <= max_len and _DIGITS.issuperset(field)):
+        raise ValueError(f"bad timestamp field: {field!r}")
+
+
+def _parse_clean_timestamp(clean_ts: str) -> int:
+    """Parse "9/12/25, 13:25:29:271" to microseconds by slicing the fixed fields"""
+    try:
+        date_part, time_part = clean_ts.split(', ', 1)
+        month, day, year = date_part.split('/')
+        hour, minute, second, frac = time_part.split(':')
+        # Only accept what the strptime format would; int() alone takes
+        # signs, spaces, underscores and any number of year digits
+        for field in (month, day, hour, minute, second):
+            _check_digits(field, 1, 2)
+        _check_digits(year, 2, 2)
+        # Fractional field is milliseconds; scale to microseconds like %f,
+        # which only takes 1-6 digits
+        _check_digits(frac, 1, 6)
+        micros = int(frac) * 10 ** (6 - len(frac))
+        year = int(year)
+        # Same two-digit year pivot as strptime's %y
+        year += 2000 if year < 69 else 1900
+        hour, minute, second = int(hour), int(minute), int(second)
+        # date() checks the day fields; check the time fields the way
+        # datetime() would, so bad stamps still fail in the fallback
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+            raise ValueError(f"time out of range: {time_part!r}")
+        return _to_micros(date(year, int(month), int(day)),
+                          hour, minute, second, micros)
+    except ValueError:
+        # Fall back to strptime for anything that doesn't fit the fixed layout
+        parsed = datetime.strptime(clean_ts, "%m/%d/%y, %H:%M:%S:%f")
+        return _to_micros(parsed.date(), parsed.hour, parsed.minute,
+                          parsed.second, parsed.microsecond)
+
+
+def _advise_sequential(file):
+    """Hint the kernel to read ahead aggressively, where supported"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        # Purely advisory; pipes and some filesystems reject it
+        pass
+
+
+def _parse_timestamp(timestamp_b: bytes) -> int:
+    """Parse timestamp from format: [9/12/25, 13:25:29:271 CDT]"""
+    parsed = _TS_CACHE.get(timestamp_b)
+    if parsed is None:
+        if len(_TS_CACHE) > _TS_CACHE_MAX:
+            _TS_CACHE.clear()
         # Remove brackets and timezone
-        clean_ts = timestamp_str.strip('[]').rsplit(' ', 1)[0]
-        # Parse the datetime
-        return datetime.strptime(clean_ts, "%m/%d/%y, %H:%M:%S:%f")
+        clean_ts = timestamp_b.decode('utf-8', 'replace').strip('[]').rsplit(' ', 1)[0]
+        parsed = _parse_clean_timestamp(clean_ts)
+        _TS_CACHE[timestamp_b] = parsed
+    return parsed
+
+
+def _is_word(token: bytes, extra: bytes = b'') -> bool:
+    """True if token is non-empty and all ASCII [A-Za-z0-9_] (plus any bytes in extra)"""
+    token = token.replace(b'_', b'a')
+    for byte in extra:
+        token = token.replace(bytes((byte,)), b'a')
+    return token.isalnum()
+
+
+def _split_line(line: bytes) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """Slice "[ts] thread id=X logger > rest" into (ts, thread, rest)
+
+    Accepts exactly what r'^\[([^\]]+)\]\s+(\w+)\s+id=\w+\s+[\w.]+\s+[><]\s+(.+)'
+    would, without running a regex.
+    """
+    if not line.startswith(b'['):
+        return None
+    end = line.find(b']')
+    if end <= 1 or not line[end + 1:end + 2].isspace():
+        return None
+    # thread, id=..., logger, direction, rest
+    parts = line[end + 1:].split(None, 4)
+    if (len(parts) < 5 or not _is_word(parts[0]) or
+            not parts[1].startswith(b'id=') or not _is_word(parts[1][3:]) or
+            not _is_word(parts[2], b'.') or parts[3] not in (b'>', b'<')):
+        return None
+    return line[1:end], parts[0], parts[4]
+
+
+# Tight loops can log byte-identical lines (same thread, same millisecond);
+# those skip parsing entirely. Duplicates sit close together, so a small cache
+# catches them and stays cheap on traces that have none.
+@functools.lru_cache(maxsize=1024)
+def _parse_trace_line(line: bytes, entry_b: bytes, exit_b: bytes) -> Optional[Tuple[bool, str, int]]:
+    """Parse a raw line into (is_entry, thread_id, timestamp), or None"""
+    line = line.strip()
+    if not line.startswith(b'['):
+        if not line:
+            return None
+        # Remove line numbers if present (like "1|", "2|", etc.)
+        if b'|' in line and line.split(b'|')[0].isdigit():
+            line = b'|'.join(line.split(b'|')[1:])
+
+    fields = _split_line(line)
+    if fields is None:
+        return None
+
+    timestamp_b, thread_b, rest_of_line = fields
+
+    # Need at least two words, e.g. "doRequest ENTRY"
+    if len(rest_of_line.split(None, 1)) < 2:
+        return None
+
+    # Look for our entry/exit patterns
+    if entry_b in rest_of_line:
+        is_entry = True
+    elif exit_b in rest_of_line:
+        is_entry = False
+    else:
+        return None
+
+    # Thread ids repeat heavily; decode each once and share the string
+    thread_id = _THREAD_IDS.get(thread_b)
+    if thread_id is None:
+        thread_id = sys.intern(thread_b.decode('utf-8', 'replace'))
+        _THREAD_IDS[thread_b] = thread_id
+    return is_entry, thread_id, _parse_timestamp(timestamp_b)
 
 
 class TraceAnalyzer:
-    def __init__(self, entry_pattern: str, exit_pattern: str, threshold_seconds: float):
+    def __init__(self, entry_pattern: str, exit_pattern: str, threshold_seconds: float,
+                 top_k: int = 50):
         self.entry_pattern = entry_pattern
         self.exit_pattern = exit_pattern
+        # Lines are never decoded as a whole, so match on encoded patterns
+        self.entry_b = entry_pattern.encode()
+        self.exit_b = exit_pattern.encode()
+        # With a shared prefix like "doRequest ", one substring search finds
+        # candidates for both patterns; too short a prefix isn't selective
+        common_b = os.path.commonprefix([self.entry_b, self.exit_b])
+        self._common_b = common_b if len(common_b) >= 4 else b''
         self.threshold_seconds = threshold_seconds
-        self.trace_pattern = re.compile(
-            r'\[([^\]]+)\]\s+(\w+)\s+id=\w+\s+[\w.]+\s+[><]\s+(.+)'
-        )
-        # Track open entries by thread_id and method_name
-        self.open_entries: Dict[str, Dict[str, TraceEntry]] = {}
-        self.completed_pairs: List[Tuple[TraceEntry, TraceEntry, float]] = []
+        if math.isfinite(threshold_seconds):
+            self.threshold_us = round(threshold_seconds * 1_000_000)
+        else:
+            # round() can't take inf or nan; as a float, inf still compares
+            # with integer durations, and nan (like inf) matches nothing
+            self.threshold_us = math.inf if math.isnan(threshold_seconds) else threshold_seconds
+        self.top_k = top_k
+        # Method name is the first word of each pattern, e.g. "doRequest ENTRY"
+        # -> "doRequest". Interned so dict lookups hit the identity fast path
+        self._entry_method = sys.intern((entry_pattern.split() or ['unknown'])[0])
+        self._exit_method = sys.intern((exit_pattern.split() or ['unknown'])[0])
+        # Usual case ("X ENTRY" / "X RETURN"): one method, so open entries
+        # can be keyed on thread_id alone
+        self._single_method = self._entry_method == self._exit_method
+        # Track open entry timestamps (microseconds) by _open_key()
+        self.open_entries: Dict[Union[str, Tuple[str, str]], int] = {}
+        # Running statistics over every completed pair
+        self.pair_count = 0
+        self.total_us = 0
+        self.min_us = math.inf
+        self.max_us = -math.inf
+        # Slow pairs seen so far, and a min-heap of the top_k slowest as
+        # (duration, -order, thread_id, method_name, entry_time, exit_time)
+        self.slow_count = 0
+        self._top: List[tuple] = []
         
-    def parse_line(self, line: str) -> Optional[TraceEntry]:
-        """Parse a single log line and extract trace information"""
-        line = line.strip()
-        if not line:
+    def parse_line(self, line: bytes) -> Optional[Tuple[str, str, str, int]]:
+        """Parse a single raw log line into (entry_type, thread_id, method_name, timestamp)"""
+        # Cheap substring check first; most lines match neither pattern
+        if self._common_b and self._common_b not in line:
             return None
-            
-        # Remove line numbers if present (like "1|", "2|", etc.)
-        if '|' in line and line.split('|')[0].isdigit():
-            line = '|'.join(line.split('|')[1:])
-            
-        match = self.trace_pattern.match(line)
-        if not match:
+        if self.entry_b not in line and self.exit_b not in line:
             return None
-            
-        timestamp_str, thread_id, rest_of_line = match.groups()
-        
-        # Extract method name - it's typically the last word before ENTRY/RETURN
-        parts = rest_of_line.split()
-        if len(parts) < 2:
+        parsed = _parse_trace_line(line, self.entry_b, self.exit_b)
+        if parsed is None:
             return None
-            
-        # Look for our entry/exit patterns
-        if self.entry_pattern in rest_of_line:
-            method_name = self._extract_method_name(rest_of_line, self.entry_pattern)
-            return TraceEntry(timestamp_str, thread_id, method_name, 'ENTRY', line)
-        elif self.exit_pattern in rest_of_line:
-            method_name = self._extract_method_name(rest_of_line, self.exit_pattern)
-            return TraceEntry(timestamp_str, thread_id, method_name, 'EXIT', line)
-            
-        return None
-        
-    def _extract_method_name(self, line: str, pattern: str) -> str:
-        """Extract method name from the pattern"""
-        # Extract the method name from the pattern itself
-        # For "doRequest ENTRY" -> extract "doRequest"
-        # For "doRequest RETURN" -> extract "doRequest"
-        words = pattern.split()
-        if words:
-            return words[0]
-        return "unknown"
-        
-    def process_entry(self, entry: TraceEntry):
+        is_entry, thread_id, timestamp = parsed
+        if is_entry:
+            return 'ENTRY', thread_id, self._entry_method, timestamp
+        return 'EXIT', thread_id, self._exit_method, timestamp
+
+    def _open_key(self, thread_id: str, method_name: str) -> Union[str, Tuple[str, str]]:
+        """Key for open_entries; process_entry/process_exit inline this"""
+        return thread_id if self._single_method else (thread_id, method_name)
+
+    def process_entry(self, thread_id: str, method_name: str, timestamp: int):
         """Process an entry trace"""
-        if entry.thread_id not in self.open_entries:
-            self.open_entries[entry.thread_id] = {}
-            
-        # Store the entry, keyed by method name
-        self.open_entries[entry.thread_id][entry.method_name] = entry
+        if self._single_method:
+            self.open_entries[thread_id] = timestamp
+        else:
+            self.open_entries[(thread_id, method_name)] = timestamp
         
-    def process_exit(self, exit_entry: TraceEntry):
+    def process_exit(self, thread_id: str, method_name: str, timestamp: int):
         """Process an exit trace and match with corresponding entry"""
-        thread_id = exit_entry.thread_id
-        method_name = exit_entry.method_name
-        
-        if (thread_id in self.open_entries and 
-            method_name in self.open_entries[thread_id]):
-            
-            entry_trace = self.open_entries[thread_id][method_name]
-            
-            # Calculate time difference in seconds
-            time_diff = (exit_entry.timestamp - entry_trace.timestamp).total_seconds()
-            
-            self.completed_pairs.append((entry_trace, exit_entry, time_diff))
-            
-            # Remove the matched entry
-            del self.open_entries[thread_id][method_name]
-            if not self.open_entries[thread_id]:
-                del self.open_entries[thread_id]
+        # Pop removes the matched entry in the same lookup
+        if self._single_method:
+            entry_time = self.open_entries.pop(thread_id, None)
+        else:
+            entry_time = self.open_entries.pop((thread_id, method_name), None)
+        if entry_time is not None:
+            duration = timestamp - entry_time
+
+            self.pair_count += 1
+            self.total_us += duration
+            if duration < self.min_us:
+                self.min_us = duration
+            if duration > self.max_us:
+                self.max_us = duration
+
+            if duration >= self.threshold_us:
+                self._push_slow(duration, thread_id, method_name, entry_time, timestamp)
                 
-    def analyze_file(self, filename: str):
+    def _push_slow(self, duration: int, thread_id: str, method_name: str,
+                   entry_time: int, exit_time: int):
+        """Record a slow pair, keeping only the top_k slowest"""
+        # Negated order makes later pairs lose ties, matching a stable sort
+        item = (duration, -self.slow_count, thread_id, method_name, entry_time, exit_time)
+        self.slow_count += 1
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, item)
+        else:
+            heapq.heappushpop(self._top, item)
+
+    def _iter_blocks(self, file, limit: Optional[int] = None):
+        """Yield (buffer, end, eol) where buffer[:end] holds only whole lines ending in eol"""
+        leftover = b''
+        eol = None
+        while limit is None or limit > 0:
+            size = _READ_SIZE if limit is None else min(_READ_SIZE, limit)
+            chunk = file.read(size)
+            if not chunk:
+                break
+            if limit is not None:
+                limit -= len(chunk)
+            data = leftover + chunk
+            if eol is None and (b'\n' in data or b'\r' in data):
+                eol = _line_break(data, 0, len(data))
+            end = data.rfind(eol) if eol else -1
+            if end < 0:
+                leftover = data
+                continue
+            yield data, end, eol
+            # Text after the last newline is a partial line; carry it forward
+            leftover = data[end + 1:]
+        if leftover:
+            yield leftover, len(leftover), eol or b'\n'
+
+    def _iter_candidates(self, file, limit: Optional[int] = None):
+        """Yield raw lines containing the entry or exit pattern
+
+        Rather than visiting every line, search for the next occurrence of
+        either pattern and cut out just the line around it. The file is
+        memory-mapped so the search runs over the page cache directly.
+        """
+        find_lines = self._find_common_lines if self._common_b else self._find_either_lines
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and pipes can't be mapped; read those in blocks
+            for buf, end, eol in self._iter_blocks(file, limit):
+                yield from find_lines(buf, 0, end, eol)
+            return
+
+        with mm:
+            start = file.tell()
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            end = len(mm) if limit is None else min(len(mm), start + limit)
+            eol = _line_break(mm, start, end)
+            yield from find_lines(mm, start, end, eol)
+
+    def _line_around(self, buf, pos: int, hit: int, end: int, eol: bytes) -> Tuple[int, int]:
+        """(start, stop) of the line containing hit, given pos is a line start before it"""
+        newline = buf.rfind(eol, pos, hit)
+        start = newline + 1 if newline >= 0 else pos
+        stop = buf.find(eol, hit, end)
+        return start, stop if stop >= 0 else end
+
+    def _find_common_lines(self, buf, pos: int, end: int, eol: bytes):
+        """Lines in buf[pos:end] with either pattern, searching only for their common prefix"""
+        common_b = self._common_b
+        entry_b = self.entry_b
+        exit_b = self.exit_b
+        entry_len = len(entry_b)
+        exit_len = len(exit_b)
+        hit = buf.find(common_b, pos, end)
+        while hit >= 0:
+            # Bounded find() rather than startswith(), which mmap lacks
+            if (buf.find(entry_b, hit, hit + entry_len) == hit or
+                    buf.find(exit_b, hit, hit + exit_len) == hit):
+                start, stop = self._line_around(buf, pos, hit, end, eol)
+                yield buf[start:stop]
+                pos = stop + 1
+                hit = buf.find(common_b, pos, end)
+            else:
+                hit = buf.find(common_b, hit + 1, end)
+
+    def _find_either_lines(self, buf, pos: int, end: int, eol: bytes):
+        """Lines in buf[pos:end] with either pattern, searching for each separately"""
+        entry_b = self.entry_b
+        exit_b = self.exit_b
+        next_entry = buf.find(entry_b, pos, end)
+        next_exit = buf.find(exit_b, pos, end)
+        while next_entry >= 0 or next_exit >= 0:
+            if next_exit < 0 or 0 <= next_entry < next_exit:
+                hit = next_entry
+            else:
+                hit = next_exit
+            start, stop = self._line_around(buf, pos, hit, end, eol)
+            yield buf[start:stop]
+
+            # Only re-search for a pattern whose last hit we've moved past
+            pos = stop + 1
+            if 0 <= next_entry < pos:
+                next_entry = buf.find(entry_b, pos, end)
+            if 0 <= next_exit < pos:
+                next_exit = buf.find(exit_b, pos, end)
+
+    def _scan(self, file, limit: Optional[int] = None):
+        """Parse lines from the file's current position and match entries to exits"""
+        # This is the per-line loop, so bind everything it touches to locals
+        entry_b = self.entry_b
+        exit_b = self.exit_b
+        entry_method = self._entry_method
+        exit_method = self._exit_method
+        process_entry = self.process_entry
+        process_exit = self.process_exit
+        for raw_line in self._iter_candidates(file, limit):
+            parsed = _parse_trace_line(raw_line, entry_b, exit_b)
+            if parsed is None:
+                continue
+
+            is_entry, thread_id, timestamp = parsed
+            if is_entry:
+                process_entry(thread_id, entry_method, timestamp)
+            else:
+                process_exit(thread_id, exit_method, timestamp)
+
+    def _chunk_offsets(self, filename: str, jobs: int) -> List[int]:
+        """Split the file into up to `jobs` byte ranges aligned to line starts"""
+        size = os.path.getsize(filename)
+        offsets = [0]
+        with open(filename, 'rb') as file:
+            for k in range(1, jobs):
+                file.seek(k * size // jobs)
+                file.readline()
+                pos = file.tell()
+                if offsets[-1] < pos < size:
+                    offsets.append(pos)
+        offsets.append(size)
+        return offsets
+
+    def _analyze_parallel(self, filename: str, jobs: int):
+        """Parse byte ranges in worker processes and stitch the results together"""
+        offsets = self._chunk_offsets(filename, jobs)
+        ranges = list(zip(offsets[:-1], offsets[1:]))
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(_analyze_chunk, self.entry_pattern, self.exit_pattern,
+                            self.threshold_seconds, self.top_k, filename, start, end)
+                for start, end in ranges
+            ]
+            # Chunks must be merged in file order, whichever finishes first
+            for future in futures:
+                self._merge_chunk(*future.result())
+
+    def _pair_stats(self) -> tuple:
+        """Running statistics as (count, total, min, max, slow count), times in microseconds"""
+        return self.pair_count, self.total_us, self.min_us, self.max_us, self.slow_count
+
+    def _merge_chunk(self, top: List[tuple], stats: tuple, open_entries, leading):
+        """Fold one chunk's results into this analyzer, in file order
+
+        `leading` lists the first event each (thread, method) saw in the chunk.
+        A leading exit may close an entry left open by earlier chunks; a
+        leading entry replaces it, just as it would in a serial scan.
+        """
+        # The chunk's slowest pairs in the order it found them; -item[1] is
+        # how many slow pairs the chunk had seen before each one
+        top = sorted(top, key=lambda item: -item[1])
+        done = 0
+        for position, thread_id, method_name, exit_time in leading:
+            # Re-record slow pairs in the order a serial scan would produce
+            while done < len(top) and -top[done][1] < position:
+                self._push_slow(top[done][0], *top[done][2:])
+                done += 1
+            if exit_time is not None:
+                self.process_exit(thread_id, method_name, exit_time)
+            else:
+                self.open_entries.pop(self._open_key(thread_id, method_name), None)
+        for item in top[done:]:
+            self._push_slow(item[0], *item[2:])
+
+        count, total_us, min_us, max_us, slow_count = stats
+        self.pair_count += count
+        # _push_slow above only counted the chunk's slow pairs that made its top_k
+        self.slow_count += slow_count - len(top)
+        self.total_us += total_us
+        self.min_us = min(self.min_us, min_us)
+        self.max_us = max(self.max_us, max_us)
+
+        self.open_entries.update(open_entries)
+
+    def analyze_file(self, filename: str, jobs: int = 1):
         """Analyze a trace log file"""
         print(f"Analyzing trace file: {filename}")
         print(f"Looking for entry pattern: '{self.entry_pattern}'")
@@ -126,18 +478,14 @@ class TraceAnalyzer:
         print("-" * 80)
         
         try:
-            with open(filename, 'r') as file:
-                line_num = 0
-                for line in file:
-                    line_num += 1
-                    entry = self.parse_line(line)
-                    
-                    if entry:
-                        if entry.entry_type == 'ENTRY':
-                            self.process_entry(entry)
-                        elif entry.entry_type == 'EXIT':
-                            self.process_exit(entry)
-                            
+            # Not worth the process start-up cost for small files
+            if jobs > 1 and os.path.getsize(filename) > _READ_SIZE:
+                self._analyze_parallel(filename, jobs)
+            else:
+                with open(filename, 'rb', buffering=1 << 20) as file:
+                    _advise_sequential(file)
+                    self._scan(file)
+
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found")
             sys.exit(1)
@@ -148,39 +496,72 @@ class TraceAnalyzer:
     def report_results(self):
         """Generate and display the analysis results"""
         print(f"\nAnalysis Results:")
-        print(f"Total matched entry/exit pairs: {len(self.completed_pairs)}")
-        
-        # Filter pairs that exceed the threshold
-        slow_operations = [
-            (entry, exit, duration) for entry, exit, duration in self.completed_pairs
-            if duration >= self.threshold_seconds
-        ]
+        print(f"Total matched entry/exit pairs: {self.pair_count}")
         
-        if slow_operations:
+        if self._top:
             print(f"\nOperations exceeding {self.threshold_seconds} seconds threshold:")
+            if self.slow_count > len(self._top):
+                print(f"(showing the {len(self._top)} slowest of {self.slow_count})")
             print("-" * 120)
             print(f"{'Thread ID':<10} {'Method':<30} {'Duration (s)':<12} {'Entry Time':<25} {'Exit Time':<25}")
             print("-" * 120)
             
-            for entry, exit, duration in sorted(slow_operations, key=lambda x: x[2], reverse=True):
-                print(f"{entry.thread_id:<10} {entry.method_name:<30} {duration:<12.3f} "
-                      f"{entry.timestamp.strftime('%H:%M:%S.%f')[:-3]:<25} "
-                      f"{exit.timestamp.strftime('%H:%M:%S.%f')[:-3]:<25}")
+            for duration, _, thread_id, method_name, entry_time, exit_time in sorted(self._top, reverse=True):
+                print(f"{thread_id:<10} {method_name:<30} {duration / 1e6:<12.3f} "
+                      f"{_from_micros(entry_time).strftime('%H:%M:%S.%f')[:-3]:<25} "
+                      f"{_from_micros(exit_time).strftime('%H:%M:%S.%f')[:-3]:<25}")
         else:
             print(f"\nNo operations found exceeding {self.threshold_seconds} seconds threshold.")
             
         # Report unmatched entries
-        unmatched_count = sum(len(methods) for methods in self.open_entries.values())
+        unmatched_count = len(self.open_entries)
         if unmatched_count > 0:
             print(f"\nWarning: {unmatched_count} unmatched entry points found (no corresponding exits)")
             
         # Show summary statistics
-        if self.completed_pairs:
-            durations = [duration for _, _, duration in self.completed_pairs]
+        if self.pair_count:
             print(f"\nTiming Statistics:")
-            print(f"  Minimum duration: {min(durations):.3f} seconds")
-            print(f"  Maximum duration: {max(durations):.3f} seconds")
-            print(f"  Average duration: {sum(durations)/len(durations):.3f} seconds")
+            print(f"  Minimum duration: {self.min_us / 1e6:.3f} seconds")
+            print(f"  Maximum duration: {self.max_us / 1e6:.3f} seconds")
+            print(f"  Average duration: {self.total_us / self.pair_count / 1e6:.3f} seconds")
+
+
+class _ChunkAnalyzer(TraceAnalyzer):
+    """Analyzer for one byte range that also records each key's first event"""
+
+    def __init__(self, entry_pattern: str, exit_pattern: str, threshold_seconds: float,
+                 top_k: int):
+        super().__init__(entry_pattern, exit_pattern, threshold_seconds, top_k)
+        self.seen = set()
+        # (slow pair count, thread_id, method_name, exit time or None for an entry)
+        self.leading: List[Tuple[int, str, str, Optional[int]]] = []
+
+    def process_entry(self, thread_id: str, method_name: str, timestamp: int):
+        key = (thread_id, method_name)
+        if key not in self.seen:
+            self.seen.add(key)
+            self.leading.append((self.slow_count, thread_id, method_name, None))
+        super().process_entry(thread_id, method_name, timestamp)
+
+    def process_exit(self, thread_id: str, method_name: str, timestamp: int):
+        key = (thread_id, method_name)
+        if key not in self.seen:
+            # Nothing open in this chunk yet; an earlier chunk may hold the entry
+            self.seen.add(key)
+            self.leading.append((self.slow_count, thread_id, method_name, timestamp))
+        super().process_exit(thread_id, method_name, timestamp)
+
+
+def _analyze_chunk(entry_pattern: str, exit_pattern: str, threshold_seconds: float,
+                   top_k: int, filename: str, start: int, end: int):
+    """Worker entry point: analyze bytes [start, end) of the file"""
+    analyzer = _ChunkAnalyzer(entry_pattern, exit_pattern, threshold_seconds, top_k)
+    with open(filename, 'rb', buffering=1 << 20) as file:
+        _advise_sequential(file)
+        file.seek(start)
+        analyzer._scan(file, end - start)
+    return (analyzer._top, analyzer._pair_stats(),
+            analyzer.open_entries, analyzer.leading)
 
 
 def main():
@@ -204,11 +585,18 @@ Examples:
                        help='Exit pattern to search for (e.g., "doRequest RETURN")')
     parser.add_argument('--threshold', type=float, required=True,
                        help='Time threshold in seconds to report slow operations')
+    parser.add_argument('--top', type=int, default=50,
+                       help='Number of slowest operations to list (default: 50)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of worker processes to parse with (default: 1); '
+                            'files of 4 MiB or less are always parsed in one process')
     
     args = parser.parse_args()
+    if args.top < 1:
+        parser.error('--top must be at least 1')
     
-    analyzer = TraceAnalyzer(args.entry, args.exit, args.threshold)
-    analyzer.analyze_file(args.logfile)
+    analyzer = TraceAnalyzer(args.entry, args.exit, args.threshold, args.top)
+    analyzer.analyze_file(args.logfile, args.jobs)
     analyzer.report_results()
 
 